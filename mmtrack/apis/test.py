@@ -1,6 +1,7 @@
 # Copyright (c) OpenMMLab. All rights reserved.
 import os
 import os.path as osp
+import pickle
 import shutil
 import tempfile
 import time
@@ -130,7 +131,9 @@ def multi_gpu_test(model, data_loader, tmpdir=None, gpu_collect=False):
         model (nn.Module): Model to be tested.
         data_loader (nn.Dataloader): Pytorch data loader.
         tmpdir (str): Path of directory to save the temporary results from
-            different gpus under cpu mode. Defaults to None.
+            different gpus under cpu mode. If specified, the directory is kept
+            and only the temporary result files are removed after collection.
+            Defaults to None.
         gpu_collect (bool): Option to use either gpu or cpu to collect results.
             Defaults to False.
 
@@ -177,31 +180,46 @@ def collect_results_cpu(result_part, tmpdir=None):
         result_part (dict[list]): The part of prediction results.
         tmpdir (str): Path of directory to save the temporary results from
             different gpus under cpu mode. If is None, use `tempfile.mkdtemp()`
-            to make a temporary path. Defaults to None.
+            to make a temporary path, which is removed after collection.
+            Otherwise only the part files are removed. Defaults to None.
 
     Returns:
         dict[str, list]: The prediction results.
     """
     rank, world_size = get_dist_info()
+    is_tmpdir_created = tmpdir is None
     # create a tmp dir if it is not specified
-    if tmpdir is None:
-        MAX_LEN = 512
-        # 32 is whitespace
-        dir_tensor = torch.full((MAX_LEN, ),
-                                32,
-                                dtype=torch.uint8,
-                                device='cuda')
-        if rank == 0:
-            tmpdir = tempfile.mkdtemp()
-            tmpdir = torch.tensor(
-                bytearray(tmpdir.encode()), dtype=torch.uint8, device='cuda')
-            dir_tensor[:len(tmpdir)] = tmpdir
-        dist.broadcast(dir_tensor, 0)
-        tmpdir = dir_tensor.cpu().numpy().tobytes().decode().rstrip()
+    if is_tmpdir_created:
+        if hasattr(dist, 'broadcast_object_list'):
+            dir_list = [tempfile.mkdtemp() if rank == 0 else None]
+            dist.broadcast_object_list(dir_list, src=0)
+            tmpdir = dir_list[0]
+        else:
+            # `broadcast_object_list` is only available since PyTorch 1.8
+            MAX_LEN = 512
+            # 32 is whitespace
+            dir_tensor = torch.full((MAX_LEN, ),
+                                    32,
+                                    dtype=torch.uint8,
+                                    device='cuda')
+            if rank == 0:
+                tmpdir = tempfile.mkdtemp()
+                tmpdir = torch.tensor(
+                    bytearray(tmpdir.encode()),
+                    dtype=torch.uint8,
+                    device='cuda')
+                dir_tensor[:len(tmpdir)] = tmpdir
+            dist.broadcast(dir_tensor, 0)
+            tmpdir = dir_tensor.cpu().numpy().tobytes().decode().rstrip()
     else:
         mmcv.mkdir_or_exist(tmpdir)
-    # dump the part result to the dir
-    mmcv.dump(result_part, osp.join(tmpdir, f'part_{rank}.pkl'))
+    # dump the part result to the dir. The default pickle protocol (2) of
+    # mmcv stores the bytes of ndarrays as latin-1 strings, which inflates
+    # the part files, so use the highest protocol shared by all ranks.
+    mmcv.dump(
+        result_part,
+        osp.join(tmpdir, f'part_{rank}.pkl'),
+        protocol=pickle.HIGHEST_PROTOCOL)
     dist.barrier()
     # collect all parts
     if rank != 0:
@@ -209,10 +227,17 @@ def collect_results_cpu(result_part, tmpdir=None):
     else:
         # load results of all parts from tmp dir
         part_list = defaultdict(list)
-        for i in range(world_size):
-            part_file = osp.join(tmpdir, f'part_{i}.pkl')
-            part_file = mmcv.load(part_file)
-            for k, v in part_file.items():
+        part_files = [
+            osp.join(tmpdir, f'part_{i}.pkl') for i in range(world_size)
+        ]
+        for part_file in part_files:
+            part_result = mmcv.load(part_file)
+            for k, v in part_result.items():
                 part_list[k].extend(v)
-        shutil.rmtree(tmpdir)
+        # only remove the files written above from a user-specified tmpdir
+        if is_tmpdir_created:
+            shutil.rmtree(tmpdir)
+        else:
+            for part_file in part_files:
+                os.remove(part_file)
         return part_list
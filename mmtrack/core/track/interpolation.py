@@ -19,7 +19,7 @@ def _interpolate_track(track, track_id, max_num_frames=20):
         'The track id should not changed when interpolate a track.'
 
     frame_ids = track[:, 0]
-    interpolated_track = np.zeros((0, 7))
+    interpolated_track = [track]
     # perform interpolation for the disconnected frames in the track.
     for i in np.where(np.diff(frame_ids) > 1)[0]:
         left_frame_id = frame_ids[i]
@@ -31,18 +31,15 @@ def _interpolate_track(track, track_id, max_num_frames=20):
             right_bbox = track[i + 1, 2:6]
 
             # perform interpolation for two adjacent tracklets.
-            for j in range(1, num_disconnected_frames):
-                cur_bbox = j / (num_disconnected_frames) * (
-                    right_bbox - left_bbox) + left_bbox
-                cur_result = np.ones((7, ))
-                cur_result[0] = j + left_frame_id
-                cur_result[1] = track_id
-                cur_result[2:6] = cur_bbox
-
-                interpolated_track = np.concatenate(
-                    (interpolated_track, cur_result[None]), axis=0)
-
-    interpolated_track = np.concatenate((track, interpolated_track), axis=0)
+            j = np.arange(1, num_disconnected_frames)
+            cur_results = np.ones((num_disconnected_frames - 1, 7))
+            cur_results[:, 0] = j + left_frame_id
+            cur_results[:, 1] = track_id
+            cur_results[:, 2:6] = (j / num_disconnected_frames)[:, None] * (
+                right_bbox - left_bbox) + left_bbox
+            interpolated_track.append(cur_results)
+
+    interpolated_track = np.concatenate(interpolated_track, axis=0)
     return interpolated_track
 
 
@@ -65,14 +62,15 @@ def interpolate_tracks(tracks, min_num_frames=5, max_num_frames=20):
         ndarray: The interpolated tracks with shape (N, 7). Each row denotes
             (frame_id, track_id, x1, y1, x2, y2, score)
     """
-    max_track_id = int(np.max(tracks[:, 1]))
-    min_track_id = int(np.min(tracks[:, 1]))
+    # group the rows of each track in one pass, keeping their order
+    inds = np.argsort(tracks[:, 1], kind='stable')
+    sorted_tracks = tracks[inds]
+    track_ids, split_inds = np.unique(sorted_tracks[:, 1], return_index=True)
 
     # perform interpolation for each track
     interpolated_tracks = []
-    for track_id in range(min_track_id, max_track_id + 1):
-        inds = tracks[:, 1] == track_id
-        track = tracks[inds]
+    for track_id, track in zip(track_ids,
+                               np.split(sorted_tracks, split_inds[1:])):
         num_frames = len(track)
         if num_frames <= 2:
             continue
@@ -84,5 +82,8 @@ def interpolate_tracks(tracks, min_num_frames=5, max_num_frames=20):
             interpolated_track = track
         interpolated_tracks.append(interpolated_track)
 
+    if len(interpolated_tracks) == 0:
+        return np.zeros((0, 7))
+
     interpolated_tracks = np.concatenate(interpolated_tracks)
     return interpolated_tracks[interpolated_tracks[:, 0].argsort()]
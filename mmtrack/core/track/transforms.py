@@ -48,6 +48,17 @@ def _imrenormalize(img, img_norm_cfg, new_img_norm_cfg):
     return img
 
 
+def _to_numpy(x):
+    """Convert a tensor to ndarray.
+
+    `Tensor.cpu()` returns the tensor itself when it is already on cpu, so the
+    returned ndarray shares memory with a cpu tensor instead of copying it.
+    """
+    if isinstance(x, torch.Tensor):
+        return x.detach().cpu().numpy()
+    return x
+
+
 def outs2results(bboxes=None,
                  labels=None,
                  masks=None,
@@ -92,10 +103,24 @@ def outs2results(bboxes=None,
                     for i in range(num_classes)
                 ]
             else:
-                if isinstance(bboxes, torch.Tensor):
-                    bboxes = bboxes.cpu().numpy()
-                    labels = labels.cpu().numpy()
-                    ids = ids.cpu().numpy()
+                if isinstance(bboxes, torch.Tensor) and bboxes.is_cuda:
+                    # copy ids, labels and bboxes to host in one transfer.
+                    # Some trackers create `ids` on cpu, so move them to the
+                    # device of `bboxes` first. float64 holds the integer ids
+                    # and the float32 bboxes exactly.
+                    ids = ids.to(bboxes.device).double()
+                    labels = labels.to(bboxes.device).double()
+                    outs = _to_numpy(
+                        torch.cat(
+                            (ids[:, None], labels[:, None], bboxes.double()),
+                            dim=1))
+                    ids = outs[:, 0].astype(np.int64)
+                    labels = outs[:, 1].astype(np.int64)
+                    bboxes = outs[:, 2:]
+                else:
+                    bboxes = _to_numpy(bboxes)
+                    labels = _to_numpy(labels)
+                    ids = _to_numpy(ids)
                 bbox_results = [
                     np.concatenate(
                         (ids[labels == i, None], bboxes[labels == i, :]),
@@ -108,8 +133,9 @@ def outs2results(bboxes=None,
     if masks is not None:
         if ids is not None:
             masks = masks[valid_inds]
-        if isinstance(masks, torch.Tensor):
-            masks = masks.detach().cpu().numpy()
+        masks = _to_numpy(masks)
+        # move labels to host once instead of syncing for each instance
+        labels = _to_numpy(labels)
         masks_results = [[] for _ in range(num_classes)]
         for i in range(bboxes.shape[0]):
             masks_results[labels[i]].append(masks[i])
@@ -138,6 +138,7 @@ class GOT10kDataset(BaseSOTDataset):
             f'-------- There are total {len(track_bboxes)} images --------',
             logger=logger)
 
+        format_line = '{:.4f},{:.4f},{:.4f},{:.4f}\n'.format
         start_ind = end_ind = 0
         for num, video_info in zip(self.num_frames_per_video, self.data_infos):
             end_ind += num
@@ -149,21 +150,16 @@ class GOT10kDataset(BaseSOTDataset):
                                       '{}_001.txt'.format(video_name))
             video_time_txt = osp.join(video_resfiles_path,
                                       '{}_time.txt'.format(video_name))
+            bboxes = np.stack(results['track_bboxes'][start_ind:end_ind])
+            # convert bbox format from (x1, y1, x2, y2) to (x1, y1, w, h)
+            bboxes[:, 2:4] -= bboxes[:, :2]
+            lines = [format_line(*bbox) for bbox in bboxes[:, :4].tolist()]
             with open(video_bbox_txt,
                       'w') as f_bbox, open(video_time_txt, 'w') as f_time:
-
-                for bbox in results['track_bboxes'][start_ind:end_ind]:
-                    bbox = [
-                        str(f'{bbox[0]:.4f}'),
-                        str(f'{bbox[1]:.4f}'),
-                        str(f'{(bbox[2] - bbox[0]):.4f}'),
-                        str(f'{(bbox[3] - bbox[1]):.4f}')
-                    ]
-                    line = ','.join(bbox) + '\n'
-                    f_bbox.writelines(line)
-                    # We don't record testing time, so we set a default
-                    # time in order to test on the server.
-                    f_time.writelines('0.0001\n')
+                f_bbox.write(''.join(lines))
+                # We don't record testing time, so we set a default
+                # time in order to test on the server.
+                f_time.write('0.0001\n' * len(lines))
             start_ind += num
 
         shutil.make_archive(resfile_path, 'zip', resfile_path)
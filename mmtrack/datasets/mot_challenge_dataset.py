@@ -200,51 +200,82 @@ class MOTChallengeDataset(CocoVideoDataset):
         for frame_id, result in enumerate(results):
             outs_track = results2outs(bbox_results=result)
             track_ids, bboxes = outs_track['ids'], outs_track['bboxes']
-            frame_ids = np.full_like(track_ids, frame_id)
-            results_per_frame = np.concatenate(
-                (frame_ids[:, None], track_ids[:, None], bboxes), axis=1)
+            if len(track_ids) == 0:
+                continue
+            results_per_frame = np.empty((len(track_ids), 7), dtype=np.float64)
+            results_per_frame[:, 0] = frame_id
+            results_per_frame[:, 1] = track_ids
+            results_per_frame[:, 2:] = bboxes
             results_per_video.append(results_per_frame)
         # `results_per_video` is a ndarray with shape (N, 7). Each row denotes
         # (frame_id, track_id, x1, y1, x2, y2, score)
-        results_per_video = np.concatenate(results_per_video)
+        if results_per_video:
+            results_per_video = np.concatenate(results_per_video, axis=0)
+        else:
+            results_per_video = np.zeros((0, 7), dtype=np.float64)
 
-        if self.interpolate_tracks_cfg is not None:
+        if self.interpolate_tracks_cfg is not None and \
+                len(results_per_video) > 0:
             results_per_video = interpolate_tracks(
                 results_per_video, **self.interpolate_tracks_cfg)
 
-        with open(resfile, 'wt') as f:
-            for frame_id, info in enumerate(infos):
-                # `mot_frame_id` is the actually frame id used for evaluation.
-                # It may not start from 0.
-                if 'mot_frame_id' in info:
-                    mot_frame_id = info['mot_frame_id']
-                else:
-                    mot_frame_id = info['frame_id'] + 1
-
-                results_per_frame = \
-                    results_per_video[results_per_video[:, 0] == frame_id]
-                for i in range(len(results_per_frame)):
-                    _, track_id, x1, y1, x2, y2, conf = results_per_frame[i]
-                    f.writelines(
-                        f'{mot_frame_id},{track_id},{x1:.3f},{y1:.3f},' +
-                        f'{(x2-x1):.3f},{(y2-y1):.3f},{conf:.3f},-1,-1,-1\n')
+        # `mot_frame_id` is the actually frame id used for evaluation.
+        # It may not start from 0.
+        mot_frame_ids = []
+        for info in infos:
+            if 'mot_frame_id' in info:
+                mot_frame_ids.append(info['mot_frame_id'])
+            else:
+                mot_frame_ids.append(info['frame_id'] + 1)
+        mot_frame_ids = np.array(mot_frame_ids, dtype=np.int64)
+        frame_ids = results_per_video[:, 0].astype(np.int64)
+        valid_inds = frame_ids < len(infos)
+        results_per_video = results_per_video[valid_inds]
+        frame_ids = frame_ids[valid_inds]
+        # keep the rows of each frame in their original order
+        inds = np.argsort(frame_ids, kind='stable')
+        results_per_video, frame_ids = results_per_video[inds], frame_ids[inds]
+
+        # `mot_tracks` is a ndarray with shape (N, 7). Each row denotes
+        # (mot_frame_id, track_id, x1, y1, w, h, score)
+        mot_tracks = np.empty((len(results_per_video), 7), dtype=np.float64)
+        mot_tracks[:, 0] = mot_frame_ids[frame_ids]
+        mot_tracks[:, 1:4] = results_per_video[:, 1:4]
+        mot_tracks[:, 4:6] = results_per_video[:, 4:6] - \
+            results_per_video[:, 2:4]
+        mot_tracks[:, 6] = results_per_video[:, 6]
+
+        with open(resfile, 'wt', buffering=1 << 20) as f:
+            np.savetxt(
+                f, mot_tracks, fmt='%d,%d,%.3f,%.3f,%.3f,%.3f,%.3f,-1,-1,-1')
 
     def format_bbox_results(self, results, infos, resfile):
         """Format detection results."""
-        with open(resfile, 'wt') as f:
-            for res, info in zip(results, infos):
-                if 'mot_frame_id' in info:
-                    frame = info['mot_frame_id']
-                else:
-                    frame = info['frame_id'] + 1
+        results_per_video = []
+        for res, info in zip(results, infos):
+            bboxes = results2outs(bbox_results=res)['bboxes']
+            if len(bboxes) == 0:
+                continue
+
+            if 'mot_frame_id' in info:
+                frame = info['mot_frame_id']
+            else:
+                frame = info['frame_id'] + 1
+            # each row denotes (mot_frame_id, x1, y1, w, h, score)
+            results_per_frame = np.empty((len(bboxes), 6), dtype=np.float64)
+            results_per_frame[:, 0] = frame
+            results_per_frame[:, 1:3] = bboxes[:, :2]
+            results_per_frame[:, 3:5] = bboxes[:, 2:4] - bboxes[:, :2]
+            results_per_frame[:, 5] = bboxes[:, 4]
+            results_per_video.append(results_per_frame)
+        if results_per_video:
+            results_per_video = np.concatenate(results_per_video, axis=0)
+        else:
+            results_per_video = np.zeros((0, 6), dtype=np.float64)
 
-                outs_det = results2outs(bbox_results=res)
-                for bbox, label in zip(outs_det['bboxes'], outs_det['labels']):
-                    x1, y1, x2, y2, conf = bbox
-                    f.writelines(
-                        f'{frame},-1,{x1:.3f},{y1:.3f},{(x2-x1):.3f},' +
-                        f'{(y2-y1):.3f},{conf:.3f}\n')
-            f.close()
+        with open(resfile, 'wt', buffering=1 << 20) as f:
+            np.savetxt(
+                f, results_per_video, fmt='%d,-1,%.3f,%.3f,%.3f,%.3f,%.3f')
 
     def get_benchmark_and_eval_split(self):
         """Get benchmark and dataset split to evaluate.
@@ -373,6 +404,13 @@ class MOTChallengeDataset(CocoVideoDataset):
                 raise KeyError(f'metric {metric} is not supported.')
 
         if 'track' in metrics:
+            # check it before creating any temporary directory
+            if trackeval is None:
+                raise ImportError(
+                    'Please run '
+                    'pip install git+https://github.com/JonathonLuiten/TrackEval.git '  # noqa
+                    'to manually install trackeval')
+
             resfile_path, resfiles, names, tmp_dir = self.format_results(
                 results, resfile_path, metrics)
             print_log('Evaluate CLEAR MOT results.', logger=logger)
@@ -381,22 +419,21 @@ class MOTChallengeDataset(CocoVideoDataset):
             # support loading data from ceph
             local_dir = tempfile.TemporaryDirectory()
 
+            # the name of gt file is shared by all the videos
+            if 'half-train' in self.ann_file:
+                gt_name = 'gt_half-train.txt'
+            elif 'half-val' in self.ann_file:
+                gt_name = 'gt_half-val.txt'
+            else:
+                gt_name = 'gt.txt'
+
             for name in names:
-                if 'half-train' in self.ann_file:
-                    gt_file = osp.join(self.img_prefix,
-                                       f'{name}/gt/gt_half-train.txt')
-                elif 'half-val' in self.ann_file:
-                    gt_file = osp.join(self.img_prefix,
-                                       f'{name}/gt/gt_half-val.txt')
-                else:
-                    gt_file = osp.join(self.img_prefix, f'{name}/gt/gt.txt')
+                gt_file = osp.join(self.img_prefix, f'{name}/gt/{gt_name}')
                 res_file = osp.join(resfiles['track'], f'{name}.txt')
                 # copy gt file from ceph to local temporary directory
                 gt_dir_path = osp.join(local_dir.name, name, 'gt')
                 os.makedirs(gt_dir_path)
-                copied_gt_file = osp.join(
-                    local_dir.name,
-                    gt_file.replace(gt_file.split(name)[0], ''))
+                copied_gt_file = osp.join(gt_dir_path, gt_name)
 
                 f = open(copied_gt_file, 'wb')
                 gt_content = self.file_client.get(gt_file)
@@ -433,18 +470,9 @@ class MOTChallengeDataset(CocoVideoDataset):
                 metrics=mm.metrics.motchallenge_metrics,
                 generate_overall=True)
 
-            if trackeval is None:
-                raise ImportError(
-                    'Please run'
-                    'pip install git+https://github.com/JonathonLuiten/TrackEval.git'  # noqa
-                    'to manually install trackeval')
-
             seqmap = osp.join(resfile_path, 'videoseq.txt')
             with open(seqmap, 'w') as f:
-                f.write('name\n')
-                for name in names:
-                    f.write(name + '\n')
-                f.close()
+                f.write('name\n' + ''.join(f'{name}\n' for name in names))
 
             eval_config = trackeval.Evaluator.get_default_eval_config()
 
@@ -141,21 +141,18 @@ class TrackingNetDataset(BaseSOTDataset):
 
         # transform tracking results format
         # from [bbox_1, bbox_2, ...] to {'video_1':[bbox_1, bbox_2, ...], ...}
+        format_line = '{:.4f},{:.4f},{:.4f},{:.4f}\n'.format
         start_ind = end_ind = 0
         for num, video_info in zip(self.num_frames_per_video, self.data_infos):
             end_ind += num
             video_name = video_info['video_path'].split(os.sep)[-1]
             video_txt = osp.join(resfile_path, '{}.txt'.format(video_name))
+            bboxes = np.stack(results['track_bboxes'][start_ind:end_ind])
+            # convert bbox format from (x1, y1, x2, y2) to (x1, y1, w, h)
+            bboxes[:, 2:4] -= bboxes[:, :2]
+            lines = [format_line(*bbox) for bbox in bboxes[:, :4].tolist()]
             with open(video_txt, 'w') as f:
-                for bbox in results['track_bboxes'][start_ind:end_ind]:
-                    bbox = [
-                        str(f'{bbox[0]:.4f}'),
-                        str(f'{bbox[1]:.4f}'),
-                        str(f'{(bbox[2] - bbox[0]):.4f}'),
-                        str(f'{(bbox[3] - bbox[1]):.4f}')
-                    ]
-                    line = ','.join(bbox) + '\n'
-                    f.writelines(line)
+                f.write(''.join(lines))
             start_ind += num
 
         shutil.make_archive(resfile_path, 'zip', resfile_path)
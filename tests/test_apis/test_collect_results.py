@@ -0,0 +1,21 @@
+# Copyright (c) OpenMMLab. All rights reserved.
+import os.path as osp
+import tempfile
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+
+@patch('torch.distributed.barrier', MagicMock())
+def test_collect_results_cpu():
+    from mmtrack.apis.test import collect_results_cpu
+
+    tmp_dir = tempfile.TemporaryDirectory()
+    result_part = dict(track_bboxes=[np.zeros((2, 6)), np.ones((3, 6))])
+    results = collect_results_cpu(result_part, tmp_dir.name)
+    assert len(results['track_bboxes']) == 2
+    assert results['track_bboxes'][1].shape == (3, 6)
+    # the user-specified tmpdir is kept while the part file is removed
+    assert osp.isdir(tmp_dir.name)
+    assert not osp.exists(osp.join(tmp_dir.name, 'part_0.pkl'))
+    tmp_dir.cleanup()
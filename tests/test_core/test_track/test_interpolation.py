@@ -19,3 +19,7 @@ def test_interpolate_tracks():
     # the range of track ids should not change
     assert min(out_results[:, 1]) == min(in_results[:, 1])
     assert max(out_results[:, 1]) == max(in_results[:, 1])
+
+    # tracks that are too short to be kept yield an empty result
+    out_results = interpolate_tracks(in_results[:2])
+    assert out_results.shape == (0, 7)
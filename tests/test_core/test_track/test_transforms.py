@@ -86,6 +86,34 @@ def test_outs2results():
                                                            image_size)
 
 
+def test_outs2results_with_cpu_ids():
+    from mmtrack.core import outs2results
+    if not torch.cuda.is_available():
+        return
+
+    # some trackers (e.g. SORT, Tracktor) create `ids` on cpu while
+    # `bboxes` and `labels` stay on gpu
+    num_objects, num_classes, image_size = 8, 4, 100
+    bboxes = random_boxes(num_objects, image_size)
+    scores = torch.FloatTensor(num_objects, 1).uniform_(0, 1)
+    bboxes = torch.cat([bboxes, scores], dim=1)
+    labels = torch.randint(0, num_classes - 1, (num_objects, ))
+    ids = torch.arange(num_objects)
+    ids[0] = -1
+
+    cpu_results = outs2results(
+        bboxes=bboxes, labels=labels, ids=ids, num_classes=num_classes)
+    gpu_results = outs2results(
+        bboxes=bboxes.cuda(),
+        labels=labels.cuda(),
+        ids=ids,
+        num_classes=num_classes)
+    for cpu_result, gpu_result in zip(cpu_results['bbox_results'],
+                                      gpu_results['bbox_results']):
+        assert gpu_result.shape == cpu_result.shape
+        assert np.allclose(gpu_result, cpu_result)
+
+
 def test_results2outs():
     from mmtrack.core import results2outs
     num_classes = 3
@@ -171,3 +171,72 @@ def test_mot15_track_evaluation(dataset):
     assert eval_results['HOTA'] == 0.400
 
     tmp_dir.cleanup()
+
+
+@patch('mmtrack.datasets.MOTChallengeDataset.load_annotations', MagicMock)
+@patch('mmtrack.datasets.MOTChallengeDataset._filter_imgs', MagicMock)
+def test_mot_format_results():
+    dataset_class = DATASETS.get('MOTChallengeDataset')
+    dataset_class.cat_ids = MagicMock()
+    dataset_class.coco = MagicMock()
+
+    dataset = dataset_class(
+        ann_file=MagicMock(),
+        interpolate_tracks_cfg=dict(min_num_frames=5, max_num_frames=20),
+        pipeline=[])
+    videos = ['normal', 'no-tracks', 'short-tracks']
+    dataset.vid_ids = [1, 2, 3]
+    dataset.coco.load_vids = MagicMock(
+        return_value=[dict(name=_) for _ in videos])
+
+    # each row of a track result is (track_id, x1, y1, x2, y2, score)
+    track = np.array([[3, 10, 20, 40, 60, 0.9]], dtype=np.float32)
+    empty_track = np.zeros((0, 6), dtype=np.float32)
+    track_bboxes = [[track], [track], [track]] + \
+        [[empty_track], [empty_track]] + [[track], [track]]
+    dataset.data_infos = [dict(frame_id=i) for i in range(3)] + \
+        [dict(frame_id=i) for i in range(2)] + \
+        [dict(frame_id=i) for i in range(2)]
+
+    resfile_path, resfiles, names, tmp_dir = dataset.format_results(
+        dict(track_bboxes=track_bboxes), metrics=['track'])
+    assert names == videos
+
+    # a video with tracks
+    lines = mmcv.list_from_file(osp.join(resfiles['track'], 'normal.txt'))
+    assert len(lines) == 3
+    # track ids are written as integers, e.g. `3` instead of `3.0`
+    for frame_id, line in enumerate(lines):
+        assert line == f'{frame_id + 1},3,10.000,20.000,30.000,40.000,' + \
+            '0.900,-1,-1,-1'
+    # a video without any track
+    lines = mmcv.list_from_file(osp.join(resfiles['track'], 'no-tracks.txt'))
+    assert len(lines) == 0
+    # a video whose tracks are all too short to be kept by interpolation
+    lines = mmcv.list_from_file(
+        osp.join(resfiles['track'], 'short-tracks.txt'))
+    assert len(lines) == 0
+    tmp_dir.cleanup()
+
+    tmp_dir = tempfile.TemporaryDirectory()
+    # rows out of the range of the frame infos are dropped, and
+    # `mot_frame_id` is used if it is given
+    resfile = osp.join(tmp_dir.name, 'track.txt')
+    dataset.interpolate_tracks_cfg = None
+    infos = [
+        dict(frame_id=0, mot_frame_id=5),
+        dict(frame_id=1, mot_frame_id=6)
+    ]
+    dataset.format_track_results(track_bboxes[:3], infos, resfile)
+    lines = mmcv.list_from_file(resfile)
+    assert [line.split(',', 1)[0] for line in lines] == ['5', '6']
+
+    # each row of a detection result is (x1, y1, x2, y2, score)
+    resfile = osp.join(tmp_dir.name, 'bbox.txt')
+    det = np.array([[10, 20, 40, 60, 0.9]], dtype=np.float32)
+    empty_det = np.zeros((0, 5), dtype=np.float32)
+    infos = [dict(frame_id=0), dict(frame_id=1)]
+    dataset.format_bbox_results([[det], [empty_det]], infos, resfile)
+    lines = mmcv.list_from_file(resfile)
+    assert lines == ['1,-1,10.000,20.000,30.000,40.000,0.900']
+    tmp_dir.cleanup()
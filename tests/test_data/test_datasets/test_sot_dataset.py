@@ -2,6 +2,7 @@
 import os
 import os.path as osp
 import tempfile
+import zipfile
 
 import mmcv
 import numpy as np
@@ -166,6 +167,26 @@ def test_format_results(dataset):
 
     tmp_dir = tempfile.TemporaryDirectory()
     dataset_object.format_results(track_results, resfile_path=tmp_dir.name)
+    # the results of each video are written as rows of (x1, y1, w, h)
+    with zipfile.ZipFile(f'{tmp_dir.name}.zip') as zf:
+        start_ind = 0
+        for num, video_info in zip(dataset_object.num_frames_per_video,
+                                   dataset_object.data_infos):
+            video_name = osp.basename(video_info['video_path'])
+            expected_lines = [
+                f'{x1:.4f},{y1:.4f},{(x2 - x1):.4f},{(y2 - y1):.4f}'
+                for x1, y1, x2, y2, _ in track_bboxes[start_ind:start_ind +
+                                                      num]
+            ]
+            if dataset == 'GOT10kDataset':
+                bbox_file = f'{video_name}/{video_name}_001.txt'
+                time_file = f'{video_name}/{video_name}_time.txt'
+                time_lines = zf.read(time_file).decode().splitlines()
+                assert time_lines == ['0.0001'] * num
+            else:
+                bbox_file = f'{video_name}.txt'
+            assert zf.read(bbox_file).decode().splitlines() == expected_lines
+            start_ind += num
     if osp.isdir(tmp_dir.name):
         tmp_dir.cleanup()
     if osp.isfile(f'{tmp_dir.name}.zip'):